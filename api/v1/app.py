@@ -10,6 +10,7 @@ from flask import jsonify
 from flask_cors import CORS
 app = Flask(__name__)
 CORS(app, resources={"/*": {"origins": '0.0.0.0'}})
+app.url_map.strict_slashes = False
 app.register_blueprint(app_views)
 app.config['JSONIFY_PRETTYPRINT_REGULAR'] = True
 
@@ -27,6 +28,13 @@ def page_404(error):
     return jsonify(err_dict), 404
 
 
+@app.errorhandler(400)
+def page_400(error):
+    """ Return a JSON 400 error with the abort() description """
+    err_dict = {"error": error.description}
+    return jsonify(err_dict), 400
+
+
 if __name__ == "__main__":
     host = getenv('HBNB_API_HOST', '0.0.0.0')
     port = getenv('HBNB_API_PORT', '5000')
@@ -1,25 +1,67 @@
 #!/usr/bin/python3
 """ Places routes handler """
 from api.v1.views import app_views
-from flask import jsonify, abort, request
-from models import storage
+from flask import abort, current_app, request
+from models import storage, storage_type
+from models.amenity import Amenity
 from models.city import City
 from models.place import Place
 from models.user import User
 from models.state import State
-from api.v1.views.cities import get_all
-from api.v1.views.places_amenities import do_get_amenities
-import json
+from datetime import datetime
+from sqlalchemy import distinct, func, or_
+import orjson
+
+IMMUTABLE_FIELDS = frozenset(('id', 'user_id', 'city_id',
+                              'created_at', 'updated_at'))
+SETTABLE_FIELDS = frozenset(column.name for column in
+                            Place.__table__.columns) - IMMUTABLE_FIELDS
+PLACE_RELATIONSHIPS = tuple(Place.__mapper__.relationships.keys())
+
+
+def ojsonify(obj, status=200):
+    """
+        Serializes obj with orjson into an application/json response,
+        Place objects are serialized through place_default
+    """
+    option = 0
+    if current_app.config.get('JSONIFY_PRETTYPRINT_REGULAR'):
+        option = orjson.OPT_INDENT_2
+    return current_app.response_class(orjson.dumps(obj,
+                                                   default=place_default,
+                                                   option=option),
+                                      status=status,
+                                      mimetype='application/json')
+
+
+def fast_dict(place):
+    """
+        Builds the dictionary of a Place object from a copy of __dict__,
+        datetimes are left for orjson to format
+    """
+    fields = dict(place.__dict__)
+    fields.pop('_sa_instance_state', None)
+    for key in PLACE_RELATIONSHIPS:
+        fields.pop(key, None)
+    fields['__class__'] = 'Place'
+    return fields
+
+
+def place_default(obj):
+    """
+        orjson default hook, serializes Place objects with fast_dict
+    """
+    if isinstance(obj, Place):
+        return fast_dict(obj)
+    raise TypeError
 
 
 def check(cls, place_id):
     """
         If the place_id is not linked to any Place object, raise a 404 error
     """
-    try:
-        get_place = storage.get(cls, place_id)
-        get_place.to_dict()
-    except Exception:
+    get_place = storage.get(cls, place_id)
+    if get_place is None:
         abort(404)
     return get_place
 
@@ -30,17 +72,13 @@ def get_places(city_id, place_id):
        if place_id is not none get a Place object
     """
     if (place_id is not None):
-        get_place = check(Place, place_id).to_dict()
-        return jsonify(get_place)
+        return ojsonify(check(Place, place_id))
     my_city = storage.get(City, city_id)
     try:
         all_places = my_city.places
     except Exception:
         abort(404)
-    places = []
-    for c in all_places:
-        places.append(c.to_dict())
-    return jsonify(places)
+    return ojsonify(list(all_places))
 
 
 def delete_place(place_id):
@@ -52,7 +90,7 @@ def delete_place(place_id):
     storage.delete(get_place)
     storage.save()
     response = {}
-    return jsonify(response)
+    return ojsonify(response)
 
 
 def create_place(request, city_id):
@@ -61,22 +99,19 @@ def create_place(request, city_id):
         Return: new place object
     """
     check(City, city_id)
-    body_request = request.get_json()
+    body_request = request.get_json(silent=True)
     if (body_request is None):
         abort(400, 'Not a JSON')
-    try:
-        user_id = body_request['user_id']
-    except KeyError:
+    if 'user_id' not in body_request:
         abort(400, 'Missing user_id')
-    check(User, user_id)
-    try:
-        place_name = body_request['name']
-    except KeyError:
+    check(User, body_request['user_id'])
+    if 'name' not in body_request:
         abort(400, 'Missing name')
-    new_place = Place(name=place_name, city_id=city_id, user_id=user_id)
+    new_place = Place(name=body_request['name'], city_id=city_id,
+                      user_id=body_request['user_id'])
     storage.new(new_place)
     storage.save()
-    return jsonify(new_place.to_dict())
+    return ojsonify(new_place)
 
 
 def update_place(place_id, request):
@@ -84,14 +119,48 @@ def update_place(place_id, request):
         Updates a Place object
     """
     get_place = check(Place, place_id)
-    body_request = request.get_json()
+    body_request = request.get_json(silent=True)
     if (body_request is None):
         abort(400, 'Not a JSON')
     for k, v in body_request.items():
-        if (k not in ('id', 'created_at', 'updated_at')):
+        if (k in SETTABLE_FIELDS):
             setattr(get_place, k, v)
+    get_place.updated_at = datetime.now()
     storage.save()
-    return jsonify(get_place.to_dict())
+    return ojsonify(get_place)
+
+
+def id_list(body_request, key):
+    """
+        Returns the list of ids under key in the request body,
+        aborts with 400 if it is not a list of strings
+    """
+    ids = body_request.get(key)
+    if ids is None:
+        return []
+    if not isinstance(ids, list) or \
+            not all(isinstance(i, str) for i in ids):
+        abort(400, '{} must be a list of ids'.format(key))
+    return ids
+
+
+def search_db(states, cities, req):
+    """
+        Retrieves the matching Place objects with a single database query
+    """
+    query = storage.query(Place)
+    conditions = []
+    if states:
+        conditions.append(City.state_id.in_(states))
+    if cities:
+        conditions.append(City.id.in_(cities))
+    if conditions:
+        query = query.join(City).filter(or_(*conditions))
+    if req:
+        query = query.join(Place.amenities).filter(Amenity.id.in_(list(req)))
+        query = query.group_by(Place.id).having(
+            func.count(distinct(Amenity.id)) == len(req))
+    return query.all()
 
 
 def search(request):
@@ -99,51 +168,36 @@ def search(request):
     retrieves all Place objects depending of the JSON
     in the body of the request
     """
-    body_request = request.get_json()
+    body_request = request.get_json(silent=True)
     if body_request is None:
         abort(400, 'Not a JSON')
-    places_list = []
-    places_amenity_list = []
-    place_amenities = []
-    all_cities = []
-    states = body_request.get('states')
-    cities = body_request.get('cities')
-    amenities = body_request.get('amenities')
-    if len(body_request) == 0 or (states is None and cities is None):
-        places = storage.all(Place)
-        for p in places.values():
-            places_list.append(p.to_dict())
-    if states is not None and len(states) is not 0:
-        for id in states:
-            get_cities = get_all(id, None).json
-            for city in get_cities:
-                all_cities.append(city.get('id'))
-        for id in all_cities:
-            places = do_get_places(id, None)
-            for p in places.json:
-                places_list.append(p)
-    if cities is not None and len(cities) is not 0:
-        for id in cities:
-            places = do_get_places(id, None)
-            for p in places.json:
-                places_list.append(p)
-    if amenities is not None and len(amenities) is not 0:
-        for p in places_list:
-            place_id = p.get('id')
-            get_amenities = storage.get(Place, place_id)
-            amenity_id = get_amenities.amenities
-            for a in amenity_id:
-                place_amenities.append(a.id)
-                if (a.id in amenities):
-                    places_amenity_list.append(p)
-            place_amenities = []
-        return jsonify(places_amenity_list)
-
-    return jsonify(places_list)
+    states = id_list(body_request, 'states')
+    cities = id_list(body_request, 'cities')
+    req = frozenset(id_list(body_request, 'amenities'))
+    for state_id in states:
+        check(State, state_id)
+    for city_id in cities:
+        check(City, city_id)
+    if storage_type == "db":
+        places = search_db(states, cities, req)
+        return ojsonify(places)
+    if not states and not cities:
+        candidates = storage.all(Place).values()
+    else:
+        state_ids = set(states)
+        city_ids = set(cities)
+        city_ids.update(city.id for city in storage.all(City).values()
+                        if city.state_id in state_ids)
+        candidates = (place for place in storage.all(Place).values()
+                      if place.city_id in city_ids)
+    if req:
+        candidates = (place for place in candidates
+                      if req.issubset(place.amenity_ids))
+    return ojsonify(list(candidates))
 
 
 @app_views.route('/cities/<city_id>/places/', methods=['GET', 'POST'],
-                 defaults={'place_id': None}, strict_slashes=False)
+                 defaults={'place_id': None})
 @app_views.route('/places/<place_id>', defaults={'city_id': None},
                  methods=['GET', 'DELETE', 'PUT'])
 def places(city_id, place_id):
@@ -160,8 +214,7 @@ def places(city_id, place_id):
         return update_place(place_id, request), 200
 
 
-@app_views.route('/places_search', methods=['POST'],
-                 strict_slashes=False)
+@app_views.route('/places_search', methods=['POST'])
 def places_search():
     """
     retrieves all Place objects depending of the JSON
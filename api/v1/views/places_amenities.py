@@ -43,9 +43,10 @@ def do_delete_amenity(place_id, amenity_id):
     """
     my_place = do_check_id(place.Place, place_id)
     do_check_id(amenity.Amenity, amenity_id)
-    for i in range(len(my_place.amenities)):
-        if (my_place.amenities[i].id == amenity_id):
-            del(my_place.amenities[i])
+    amenities = my_place.amenities
+    for i, linked in enumerate(amenities):
+        if (linked.id == amenity_id):
+            del(amenities[i])
             storage.save()
             response = {}
             return jsonify(response), 200
@@ -59,10 +60,11 @@ def do_create_amenity(place_id, amenity_id):
     """
     my_place = do_check_id(place.Place, place_id)
     get_amenity = do_check_id(amenity.Amenity, amenity_id)
-    for i in range(len(my_place.amenities)):
-        if (my_place.amenities[i].id == amenity_id):
+    amenities = my_place.amenities
+    for linked in amenities:
+        if (linked.id == amenity_id):
             return jsonify(get_amenity.to_dict()), 200
-    my_place.amenities.append(get_amenity)
+    amenities.append(get_amenity)
     storage.save()
     return jsonify(get_amenity.to_dict()), 201
 
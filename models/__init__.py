@@ -2,6 +2,7 @@
 """This module instantiates an object of class FileStorage"""
 from os import getenv
 storage_type = getenv("HBNB_TYPE_STORAGE")
+storage_t = storage_type
 if storage_type == "db":
     from models.engine.db_storage import DBStorage
     storage = DBStorage()
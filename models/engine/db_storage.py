@@ -32,8 +32,10 @@ class DBStorage:
         HBNB_MYSQL_HOST = getenv('HBNB_MYSQL_HOST')
         HBNB_MYSQL_DB = getenv('HBNB_MYSQL_DB')
         HBNB_ENV = getenv('HBNB_ENV')
-        self.__engine = create_engine('mysql+mysqldb://{}:{}@{}/{}'.
-                                      format(HBNB_MYSQL_USER,
+        HBNB_MYSQL_DRIVER = getenv('HBNB_MYSQL_DRIVER', 'mysqldb')
+        self.__engine = create_engine('mysql+{}://{}:{}@{}/{}'.
+                                      format(HBNB_MYSQL_DRIVER,
+                                             HBNB_MYSQL_USER,
                                              HBNB_MYSQL_PWD,
                                              HBNB_MYSQL_HOST,
                                              HBNB_MYSQL_DB))
@@ -71,6 +73,10 @@ class DBStorage:
         Session = scoped_session(sess_factory)
         self.__session = Session
 
+    def query(self, *entities):
+        """returns a query object bound to the current database session"""
+        return self.__session.query(*entities)
+
     def close(self):
         """call remove() method on the private session attribute"""
         self.__session.remove()
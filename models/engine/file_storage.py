@@ -71,12 +71,11 @@ class FileStorage:
 
     def get(self, cls, id):
         """
-        Returns the object
+        Returns the object based on the class and its ID, or None
         """
-        obj = self.__session.query(cls).get(id)
-        if obj is None:
-            return None
-        return obj
+        if type(cls) is not str:
+            cls = cls.__name__
+        return self.__objects.get(cls + "." + str(id))
 
     def count(self, cls=None):
         """
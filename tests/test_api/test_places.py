@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+"""test for the places views of the API"""
+import unittest
+import models
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+from api.v1.app import app
+
+
+@unittest.skipIf(models.storage_type == 'db', "not testing file storage")
+class TestPlacesViews(unittest.TestCase):
+    """this will test the places views"""
+
+    def setUp(self):
+        """set up a city, a user and a place in storage"""
+        self.client = app.test_client()
+        state = State(name="California")
+        city = City(name="San Francisco", state_id=state.id)
+        user = User(email="a@b.c", password="pwd")
+        place = Place(name="Loft", city_id=city.id, user_id=user.id)
+        self.wifi = Amenity(name="Wifi")
+        self.pool = Amenity(name="Pool")
+        place.amenity_ids = [self.wifi.id]
+        self.objs = [state, city, user, place, self.wifi, self.pool]
+        for obj in self.objs:
+            storage.new(obj)
+        storage.save()
+        self.city_id = city.id
+        self.user_id = user.id
+        self.place_id = place.id
+
+    def tearDown(self):
+        """remove the objects created by the test"""
+        for obj in self.objs:
+            storage.delete(storage.get(type(obj), obj.id))
+        storage.save()
+
+    def test_put_updates_place(self):
+        """a PUT is seen by GET and places_search and bumps updated_at"""
+        url = '/api/v1/places/{}'.format(self.place_id)
+        before = self.client.get(url).get_json()
+        self.assertEqual(before['name'], "Loft")
+        resp = self.client.put(url, json={"name": "Attic"})
+        self.assertEqual(resp.status_code, 200)
+        after = self.client.get(url).get_json()
+        self.assertEqual(after['name'], "Attic")
+        self.assertNotEqual(after['updated_at'], before['updated_at'])
+        resp = self.client.post('/api/v1/places_search', json={})
+        names = {p['id']: p['name'] for p in resp.get_json()}
+        self.assertEqual(names[self.place_id], "Attic")
+
+    def test_search_sees_reloaded_amenity_ids(self):
+        """search matches the amenity_ids reloaded from file.json"""
+        body = {"amenities": [self.pool.id]}
+        resp = self.client.post('/api/v1/places_search', json=body)
+        self.assertNotIn(self.place_id, [p['id'] for p in resp.get_json()])
+        # another process links the amenity and saves file.json
+        place = storage.get(Place, self.place_id)
+        place.amenity_ids = [self.wifi.id, self.pool.id]
+        storage.save()
+        storage.reload()
+        resp = self.client.post('/api/v1/places_search', json=body)
+        self.assertIn(self.place_id, [p['id'] for p in resp.get_json()])
+
+    def test_create_place_error_order(self):
+        """user_id is checked, then the user, then name"""
+        url = '/api/v1/cities/{}/places'.format(self.city_id)
+        resp = self.client.post(url, json={"name": "Hut"})
+        self.assertEqual(resp.status_code, 400)
+        resp = self.client.post(url, json={"user_id": "bogus"})
+        self.assertEqual(resp.status_code, 404)
+        resp = self.client.post(url, json={"user_id": self.user_id})
+        self.assertEqual(resp.status_code, 400)
+
+    def test_search_rejects_bad_amenities(self):
+        """amenities must be a list of id strings"""
+        for amenities in ([{}], "abc", 42):
+            with self.subTest(amenities=amenities):
+                resp = self.client.post('/api/v1/places_search',
+                                        json={"amenities": amenities})
+                self.assertEqual(resp.status_code, 400)
+
+    def test_not_a_json(self):
+        """a body that is not JSON gets a JSON 400 error"""
+        url = '/api/v1/cities/{}/places'.format(self.city_id)
+        resp = self.client.post(url, data="name=Hut",
+                                content_type="text/plain")
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.get_json(), {"error": "Not a JSON"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -113,3 +113,17 @@ class TestFileStorage(unittest.TestCase):
         with open("file.json", "r") as f:
             js = f.read()
         self.assertEqual(json.loads(string), json.loads(js))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_get(self):
+        """Test that get returns the object by class and id, or None"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        instance = State()
+        storage.new(instance)
+        self.assertIs(storage.get(State, instance.id), instance)
+        self.assertIs(storage.get("State", instance.id), instance)
+        self.assertIsNone(storage.get(City, instance.id))
+        self.assertIsNone(storage.get(State, "missing"))
+        FileStorage._FileStorage__objects = save